@@ -218,6 +218,7 @@ class SchemaGenerator(BaseSchemaGenerator):
             path_prefix = spectacular_settings.SCHEMA_PATH_PREFIX
         if not path_prefix.startswith('^'):
             path_prefix = '^' + path_prefix  # make sure regex only matches from the start
+        path_prefix_re = re.compile(path_prefix, flags=re.IGNORECASE)
 
         for path, path_regex, method, view in endpoints:
             # emit queued up warnings/error that happened prior to generation (decoration)
@@ -262,7 +263,7 @@ class SchemaGenerator(BaseSchemaGenerator):
                 continue
 
             if spectacular_settings.SCHEMA_PATH_PREFIX_TRIM:
-                path = re.sub(pattern=path_prefix, repl='', string=path, flags=re.IGNORECASE)
+                path = path_prefix_re.sub('', path)
 
             if spectacular_settings.SCHEMA_PATH_PREFIX_INSERT:
                 path = spectacular_settings.SCHEMA_PATH_PREFIX_INSERT + path
@@ -1,9 +1,10 @@
 import copy
 import functools
 import itertools
+import operator
 import re
 from collections import defaultdict
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 import uritemplate
 from django.core import exceptions as django_exceptions
@@ -48,6 +49,48 @@ from drf_spectacular.utils import (
     _SchemaType, _SerializerType,
 )
 
+_COMPONENT_NAME_RE = re.compile(r'^[\w.-]+$')
+_PATH_VARIABLE_RE = re.compile(r'\{[\w\-]+\}')
+# falsy sentinel shared by all discarded serializer components. treat as read-only.
+_DISCARDED_COMPONENT = ResolvedComponent(None, None)
+
+# NullBooleanField was removed in 3.14. Since 3.12.0 NullBooleanField was a subclass of BooleanField
+if hasattr(serializers, 'NullBooleanField'):
+    _BOOLEAN_FIELD_CLASSES: Tuple[type, ...] = (serializers.BooleanField, serializers.NullBooleanField)
+else:
+    _BOOLEAN_FIELD_CLASSES = (serializers.BooleanField,)
+
+
+@functools.lru_cache(maxsize=1000)
+def _cached_tokenize_path(path: str, path_prefix: str) -> Tuple[str, ...]:
+    # remove path prefix
+    path = re.sub(
+        pattern=path_prefix,
+        repl='',
+        string=path,
+        flags=re.IGNORECASE
+    )
+    # remove path variables
+    path = _PATH_VARIABLE_RE.sub('', path)
+    # cleanup and tokenize remaining parts.
+    tokenized_path = path.rstrip('/').lstrip('/').split('/')
+    return tuple(t for t in tokenized_path if t)
+
+
+@functools.lru_cache(maxsize=1000)
+def _cached_ecma_pattern(pattern: str) -> str:
+    # validators (and thus their patterns) are shared by fields of the same kind
+    pattern = pattern.encode('ascii', 'backslashreplace').decode()
+    pattern = pattern.replace(r'\x', r'\u00')  # unify escaping
+    pattern = pattern.replace(r'\Z', '$').replace(r'\A', '^')  # ECMA anchors
+    return pattern
+
+
+@functools.lru_cache(maxsize=1000)
+def _cached_path_variables(path: str) -> Tuple[str, ...]:
+    # parsing the uri template is needlessly repeated for every method of a path
+    return tuple(uritemplate.variables(path))
+
 
 class AutoSchema(ViewInspector):
     method_mapping = {
@@ -71,6 +114,7 @@ class AutoSchema(ViewInspector):
         self.path_regex = path_regex
         self.path_prefix = path_prefix
         self.method = method.upper()
+        self._operation_cache: Dict[Any, Any] = {}
 
         if self.is_excluded():
             return None
@@ -131,13 +175,28 @@ class AutoSchema(ViewInspector):
         list of objects. used for operationId naming, array building and pagination.
         defaults to False if all introspection fail.
         """
-        if serializer is None:
-            serializer = self.get_response_serializers()
+        if serializer is not None:
+            return self._is_list_view_for_serializer(serializer)
+
+        # obtaining the default response serializer is costly and its outcome does not change
+        # during an operation.
+        return self._get_operation_cached(
+            'is_list_view', lambda: self._is_list_view_for_serializer(self.get_response_serializers())
+        )
+
+    def _get_operation_cached(self, name: str, func):
+        """ memoize func's result for the current operation. the cache is reset in get_operation() """
+        cache = self.__dict__.get('_operation_cache')
+        if cache is None:
+            return func()  # not within get_operation(), e.g. a manually prepared schema
+        if name not in cache:
+            cache[name] = func()
+        return cache[name]
 
+    def _is_list_view_for_serializer(self, serializer) -> bool:
         if isinstance(serializer, dict) and serializer:
             # extract likely main serializer from @extend_schema override
-            serializer = {str(code): s for code, s in serializer.items()}
-            serializer = serializer[min(serializer)]
+            serializer = serializer[min(serializer, key=str)]
 
         if is_list_serializer(serializer):
             return True
@@ -150,10 +209,11 @@ class AutoSchema(ViewInspector):
             return False
         if isinstance(self.view, ListModelMixin):
             return True
-        # primary key/lookup variable in path is a strong indicator for retrieve
-        if isinstance(self.view, GenericAPIView):
+        # primary key/lookup variable in path is a strong indicator for retrieve.
+        # paths without any variables cannot contain it, so skip the template lookup.
+        if '{' in self.path and isinstance(self.view, GenericAPIView):
             lookup_url_kwarg = self.view.lookup_url_kwarg or self.view.lookup_field
-            if lookup_url_kwarg in uritemplate.variables(self.path):
+            if lookup_url_kwarg in _cached_path_variables(self.path):
                 return False
 
         return False
@@ -251,20 +311,20 @@ class AutoSchema(ViewInspector):
         return parameters
 
     def _get_parameters(self) -> List[_SchemaType]:
-        def dict_helper(parameters):
-            return {(p['name'], p['in']): p for p in parameters}
-
         override_parameters = self._process_override_parameters()
         # remove overridden path parameters beforehand so that there are no irrelevant warnings.
         path_variables = [
-            v for v in uritemplate.variables(self.path) if (v, 'path') not in override_parameters
+            v for v in _cached_path_variables(self.path) if (v, 'path') not in override_parameters
         ]
-        parameters = {
-            **dict_helper(self._resolve_path_parameters(path_variables)),
-            **dict_helper(self._get_filter_parameters()),
-            **dict_helper(self._get_pagination_parameters()),
-            **dict_helper(self._get_format_parameters()),
-        }
+        # later sources take precedence on (name, location) clashes while keeping first position
+        parameters = {}
+        for parameter in itertools.chain(
+            self._resolve_path_parameters(path_variables),
+            self._get_filter_parameters(),
+            self._get_pagination_parameters(),
+            self._get_format_parameters(),
+        ):
+            parameters[parameter['name'], parameter['in']] = parameter
         # override/add/remove @extend_schema parameters
         for key, parameter in override_parameters.items():
             if parameter is None:
@@ -288,16 +348,15 @@ class AutoSchema(ViewInspector):
         if callable(spectacular_settings.SORT_OPERATION_PARAMETERS):
             return sorted(parameters.values(), key=spectacular_settings.SORT_OPERATION_PARAMETERS)
         elif spectacular_settings.SORT_OPERATION_PARAMETERS:
-            return sorted(parameters.values(), key=lambda p: p['name'])
+            return sorted(parameters.values(), key=operator.itemgetter('name'))
         else:
             return list(parameters.values())
 
     def get_description(self) -> str:  # type: ignore[override]
         """ override this for custom behaviour """
         action_or_method = getattr(self.view, getattr(self.view, 'action', self.method.lower()), None)
-        view_doc = get_doc(self.view.__class__)
-        action_doc = get_doc(action_or_method)
-        return action_doc or view_doc
+        # action doc takes precedence, so only walk the view's class hierarchy if needed
+        return get_doc(action_or_method) or get_doc(self.view.__class__)
 
     def get_summary(self) -> Optional[str]:
         """ override this for custom behaviour """
@@ -476,30 +535,21 @@ class AutoSchema(ViewInspector):
         return False
 
     def _tokenize_path(self) -> List[str]:
-        # remove path prefix
-        path = re.sub(
-            pattern=self.path_prefix,
-            repl='',
-            string=self.path,
-            flags=re.IGNORECASE
-        )
-        # remove path variables
-        path = re.sub(pattern=r'\{[\w\-]+\}', repl='', string=path)
-        # cleanup and tokenize remaining parts.
-        tokenized_path = path.rstrip('/').lstrip('/').split('/')
-        return [t for t in tokenized_path if t]
+        return list(_cached_tokenize_path(self.path, self.path_prefix))
 
     def _resolve_path_parameters(self, variables):
+        if not variables:
+            return []
+
         model = get_view_model(self.view, emit_warnings=False)
+        formats = self.map_renderers('format')
 
         parameters = []
         for variable in variables:
             schema = build_basic_type(OpenApiTypes.STR)
             description = ''
 
-            resolved_parameter = resolve_django_path_parameter(
-                self.path_regex, variable, self.map_renderers('format'),
-            )
+            resolved_parameter = resolve_django_path_parameter(self.path_regex, variable, formats)
             if not resolved_parameter:
                 resolved_parameter = resolve_regex_path_parameter(self.path_regex, variable)
 
@@ -549,12 +599,13 @@ class AutoSchema(ViewInspector):
 
     def _get_filter_parameters(self):
         parameters = []
-        for filter_backend in self.get_filter_backends():
-            filter_extension = OpenApiFilterExtension.get_match(filter_backend())
+        for filter_backend_class in self.get_filter_backends():
+            filter_backend = filter_backend_class()
+            filter_extension = OpenApiFilterExtension.get_match(filter_backend)
             if filter_extension:
                 parameters += filter_extension.get_schema_operation_parameters(self)
             else:
-                parameters += filter_backend().get_schema_operation_parameters(self.view)
+                parameters += filter_backend.get_schema_operation_parameters(self.view)
         return parameters
 
     def _get_pagination_parameters(self):
@@ -749,9 +800,7 @@ class AutoSchema(ViewInspector):
         if isinstance(field, serializers.StringRelatedField):
             return append_meta(build_basic_type(OpenApiTypes.STR), meta)
 
-        if isinstance(field, serializers.HyperlinkedIdentityField):
-            return append_meta(build_basic_type(OpenApiTypes.URI), meta)
-
+        # also covers HyperlinkedIdentityField, which is a HyperlinkedRelatedField subclass
         if isinstance(field, serializers.HyperlinkedRelatedField):
             return append_meta(build_basic_type(OpenApiTypes.URI), meta)
 
@@ -865,13 +914,7 @@ class AutoSchema(ViewInspector):
 
             return append_meta(self._map_response_type_hint(method), meta)
 
-        # NullBooleanField was removed in 3.14. Since 3.12.0 NullBooleanField was a subclass of BooleanField
-        if hasattr(serializers, "NullBooleanField"):
-            boolean_field_classes = (serializers.BooleanField, serializers.NullBooleanField)
-        else:
-            boolean_field_classes = (serializers.BooleanField,)
-
-        if isinstance(field, boolean_field_classes):
+        if isinstance(field, _BOOLEAN_FIELD_CLASSES):
             return append_meta(build_basic_type(OpenApiTypes.BOOL), meta)
 
         if isinstance(field, serializers.JSONField):
@@ -1107,10 +1150,7 @@ class AutoSchema(ViewInspector):
                         schema['format'] = 'uri'
                 elif isinstance(v, validators.RegexValidator):
                     if 'pattern' not in schema:
-                        pattern = v.regex.pattern.encode('ascii', 'backslashreplace').decode()
-                        pattern = pattern.replace(r'\x', r'\u00')  # unify escaping
-                        pattern = pattern.replace(r'\Z', '$').replace(r'\A', '^')  # ECMA anchors
-                        schema['pattern'] = pattern
+                        schema['pattern'] = _cached_ecma_pattern(v.regex.pattern)
                 elif isinstance(v, validators.MaxLengthValidator):
                     update_constraint(schema, 'maxLength', min, v.limit_value)
                 elif isinstance(v, validators.MinLengthValidator):
@@ -1164,10 +1204,14 @@ class AutoSchema(ViewInspector):
         return schema
 
     def _get_paginator(self):
-        pagination_class = getattr(self.view, 'pagination_class', None)
-        if pagination_class:
-            return pagination_class()
-        return None
+        def build_paginator():
+            pagination_class = getattr(self.view, 'pagination_class', None)
+            if pagination_class:
+                return pagination_class()
+            return None
+
+        # used for parameters, examples and every response code. instantiate only once.
+        return self._get_operation_cached('paginator', build_paginator)
 
     def get_paginated_name(self, serializer_name: str) -> str:
         return f'Paginated{serializer_name}List'
@@ -1188,9 +1232,10 @@ class AutoSchema(ViewInspector):
             else:
                 return not isinstance(r, renderers.BrowsableAPIRenderer)
 
+        # renderers are instantiated on every call, but needed for each parameter and response code
         return list(dict.fromkeys([
             getattr(r, attribute).split(';')[0]
-            for r in self.view.get_renderers()
+            for r in self._get_operation_cached('renderers', self.view.get_renderers)
             if use_renderer(r) and hasattr(r, attribute)
         ]))
 
@@ -1201,7 +1246,7 @@ class AutoSchema(ViewInspector):
             if isinstance(view, GenericAPIView):
                 # try to circumvent queryset issues with calling get_serializer. if view has NOT
                 # overridden get_serializer, its safe to use get_serializer_class.
-                if view.__class__.get_serializer == GenericAPIView.get_serializer:
+                if view.__class__.get_serializer is GenericAPIView.get_serializer:
                     return view.get_serializer_class()(context=context)
                 return view.get_serializer(context=context)
             elif isinstance(view, APIView):
@@ -1288,7 +1333,7 @@ class AutoSchema(ViewInspector):
 
     def _get_request_body(self, direction='request'):
         # only unsafe methods can have a body
-        if self.method not in ('PUT', 'PATCH', 'POST'):
+        if self.method not in {'PUT', 'PATCH', 'POST'}:
             return None
 
         request_serializer = self.get_request_serializer()
@@ -1356,11 +1401,14 @@ class AutoSchema(ViewInspector):
                 return None, False
             schema = component.ref
             # request body is only required if any required property is not read-only
-            readonly_props = [
-                p for p, s in component.schema.get('properties', {}).items() if s.get('readOnly')
-            ]
-            required_props = component.schema.get('required', [])
-            request_body_required = any(req not in readonly_props for req in required_props)
+            required_props = component.schema.get('required')
+            if required_props:
+                properties = component.schema.get('properties', {})
+                request_body_required = any(
+                    not properties.get(req, {}).get('readOnly') for req in required_props
+                )
+            else:
+                request_body_required = False
         elif is_basic_type(serializer):
             schema = build_basic_type(serializer)
             request_body_required = False
@@ -1398,11 +1446,13 @@ class AutoSchema(ViewInspector):
         elif isinstance(response_serializers, dict):
             # custom handling for overriding default return codes with @extend_schema
             responses = {}
+            # renderers are invariant for all codes. only resolve them once.
+            renderer_media_types = self.map_renderers('media_type')
             for code, serializer in response_serializers.items():
                 if isinstance(code, tuple):
                     code, media_types = str(code[0]), code[1:]
                 else:
-                    code, media_types = str(code), None
+                    code, media_types = str(code), renderer_media_types
                 content_response = self._get_response_for_code(serializer, code, media_types, direction)
                 if code in responses:
                     responses[code]['content'].update(content_response['content'])
@@ -1410,15 +1460,18 @@ class AutoSchema(ViewInspector):
                     responses[code] = content_response
             return responses
         else:
-            warn(
-                f'could not resolve "{response_serializers}" for {self.method} {self.path}. '
-                f'Expected either a serializer or some supported override mechanism. '
-                f'Defaulting to generic free-form object.'
-            )
+            self._warn_unresolved_response(response_serializers)
             schema = build_basic_type(OpenApiTypes.OBJECT)
             schema['description'] = _('Unspecified response body')  # type: ignore
             return {'200': self._get_response_for_code(schema, '200', direction=direction)}
 
+    def _warn_unresolved_response(self, serializer) -> None:
+        warn(
+            f'could not resolve "{serializer}" for {self.method} {self.path}. Expected either '
+            f'a serializer or some supported override mechanism. Defaulting to '
+            f'generic free-form object.'
+        )
+
     def _unwrap_list_serializer(self, serializer, direction: Direction) -> Optional[_SchemaType]:
         if is_field(serializer):
             return self._map_serializer_field(serializer, direction)
@@ -1464,11 +1517,7 @@ class AutoSchema(ViewInspector):
             # prevent invalid dict case in _is_list_view() as this not a status_code dict.
             serializer = None
         else:
-            warn(
-                f'could not resolve "{serializer}" for {self.method} {self.path}. Expected either '
-                f'a serializer or some supported override mechanism. Defaulting to '
-                f'generic free-form object.'
-            )
+            self._warn_unresolved_response(serializer)
             schema = build_basic_type(OpenApiTypes.OBJECT)
             schema['description'] = _('Unspecified response body')
 
@@ -1479,11 +1528,14 @@ class AutoSchema(ViewInspector):
         ):
             # In case of a non-default ListSerializer, check for matching extension and
             # bypass regular list wrapping by delegating handling to extension.
+            # build the list serializer only once, as it instantiates the whole child serializer
+            list_serializer = get_list_serializer(serializer) if is_serializer(serializer, strict=True) else None
             if (
-                is_list_serializer_customized(serializer)
-                and OpenApiSerializerExtension.get_match(get_list_serializer(serializer))
+                list_serializer is not None
+                and is_list_serializer_customized(list_serializer)
+                and OpenApiSerializerExtension.get_match(list_serializer)
             ):
-                schema = self._map_serializer(get_list_serializer(serializer), direction)
+                schema = self._map_serializer(list_serializer, direction)
             else:
                 schema = build_array_type(schema)
 
@@ -1620,7 +1672,7 @@ class AutoSchema(ViewInspector):
         if direction == 'request' and spectacular_settings.COMPONENT_SPLIT_REQUEST:
             name = name + 'Request'
 
-        if not re.match(r'^[\w.-]+$', name):
+        if not _COMPONENT_NAME_RE.match(name):
             warn(
                 f'Component name "{name}" contains illegal characters. Only "A-Z a-z 0-9 - . _" '
                 f'are allowed. Furthermore, "-" and "." are discoursed due to potential tooling '
@@ -1641,24 +1693,25 @@ class AutoSchema(ViewInspector):
                 type=ResolvedComponent.SCHEMA,
                 object=self.get_serializer_identity(serializer, direction),
             )
-            if component in self.registry:
-                return self.registry[component]  # return component with schema
+            registered_component = self.registry.get(component)
+            if registered_component is not None:
+                return registered_component  # return component with schema
 
             self.registry.register(component)
-            component.schema = self._map_serializer(serializer, direction, bypass_extensions)
+            schema = component.schema = self._map_serializer(serializer, direction, bypass_extensions)
 
             discard_component = (
                 # components with empty schemas serve no purpose
-                not component.schema
+                not schema
                 # concrete component without properties are likely only transactional so discard
                 or (
-                    component.schema.get('type') == 'object'
-                    and not component.schema.get('properties')
-                    and 'additionalProperties' not in component.schema
+                    schema.get('type') == 'object'
+                    and not schema.get('properties')
+                    and 'additionalProperties' not in schema
                 )
             )
 
             if discard_component:
                 del self.registry[component]
-                return ResolvedComponent(None, None)  # sentinel
+                return _DISCARDED_COMPONENT
             return component
@@ -3,6 +3,7 @@ import functools
 import hashlib
 import inspect
 import json
+import operator
 import re
 import sys
 import types
@@ -128,13 +129,16 @@ def is_serializer(obj, strict=False) -> TypeGuard[_SerializerType]:
 
     from drf_spectacular.extensions import OpenApiSerializerExtension
     return (
-        isinstance(force_instance(obj), serializers.BaseSerializer)
+        issubclass(get_class(obj), serializers.BaseSerializer)
         or (bool(OpenApiSerializerExtension.get_match(obj)) and not strict)
     )
 
 
 def is_list_serializer(obj: Any) -> TypeGuard[_ListSerializerType]:
-    return isinstance(force_instance(obj), serializers.ListSerializer)
+    # no need to instantiate a class just to find out what it would be an instance of
+    if inspect.isclass(obj):
+        return issubclass(obj, serializers.ListSerializer)
+    return isinstance(obj, serializers.ListSerializer)
 
 
 def get_list_serializer(obj: Any):
@@ -156,7 +160,7 @@ def is_basic_serializer(obj: Any) -> TypeGuard[_SerializerType]:
 def is_field(obj: Any) -> TypeGuard[_FieldType]:
     # make sure obj is a serializer field and nothing else.
     # guard against serializers because BaseSerializer(Field)
-    return isinstance(force_instance(obj), fields.Field) and not is_serializer(obj)
+    return issubclass(get_class(obj), fields.Field) and not is_serializer(obj)
 
 
 def is_basic_type(obj: Any, allow_none=True) -> TypeGuard[_KnownPythonTypes]:
@@ -176,9 +180,12 @@ def is_patched_serializer(serializer, direction) -> bool:
     )
 
 
+_TRIVIAL_STRING_VARIATION_TABLE = str.maketrans(' -', '__')
+
+
 def is_trivial_string_variation(a: str, b: str) -> bool:
-    a = (a or '').strip().lower().replace(' ', '_').replace('-', '_')
-    b = (b or '').strip().lower().replace(' ', '_').replace('-', '_')
+    a = (a or '').strip().lower().translate(_TRIVIAL_STRING_VARIATION_TABLE)
+    b = (b or '').strip().lower().translate(_TRIVIAL_STRING_VARIATION_TABLE)
     return a == b
 
 
@@ -239,16 +246,11 @@ def get_doc(obj) -> str:
     if not inspect.isclass(obj):
         return post_cleanup(inspect.getdoc(obj) or '')
 
-    def safe_index(lst, item):
-        try:
-            return lst.index(item)
-        except ValueError:
-            return float("inf")
-
-    lib_barrier = min(
-        safe_index(obj.__mro__, c) for c in spectacular_settings.GET_LIB_DOC_EXCLUDES()
-    )
-    for cls in obj.__mro__[:lib_barrier]:
+    lib_doc_excludes = spectacular_settings.GET_LIB_DOC_EXCLUDES()
+    for cls in obj.__mro__:
+        # stop at the first library class. its docs are not meant for the API.
+        if cls in lib_doc_excludes:
+            break
         if cls.__doc__:
             return post_cleanup(inspect.cleandoc(cls.__doc__))
     return ''
@@ -258,6 +260,18 @@ def get_type_hints(obj) -> Dict[str, Any]:
     """ unpack wrapped partial object and use actual func object """
     if isinstance(obj, functools.partial):
         obj = obj.func
+    if inspect.ismethod(obj):
+        # hints are identical to the underlying function's. also avoids caching bound instances.
+        obj = obj.__func__
+    try:
+        return dict(_get_type_hints_cached(obj))
+    except TypeError:
+        return typing.get_type_hints(obj)  # unhashable object
+
+
+@functools.lru_cache(maxsize=1000)
+def _get_type_hints_cached(obj) -> Dict[str, Any]:
+    # resolving (forward referenced) annotations is costly. callers receive a copy.
     return typing.get_type_hints(obj)
 
 
@@ -292,16 +306,18 @@ def build_basic_type(obj: Union[_KnownPythonTypes, OpenApiTypes]) -> Optional[_S
     """
     resolve either enum or actual type and yield schema template for modification
     """
-    openapi_type_mapping = get_openapi_type_mapping()
     if obj is None or type(obj) is None or obj is OpenApiTypes.NONE:
         return None
-    elif obj in openapi_type_mapping:
-        return dict(openapi_type_mapping[obj])
-    elif obj in PYTHON_TYPE_MAPPING:
-        return dict(openapi_type_mapping[PYTHON_TYPE_MAPPING[obj]])
-    else:
-        warn(f'could not resolve type for "{obj}". defaulting to "string"')
-        return dict(openapi_type_mapping[OpenApiTypes.STR])
+
+    openapi_type_mapping = get_openapi_type_mapping()
+    template = openapi_type_mapping.get(obj)
+    if template is None:
+        if obj in PYTHON_TYPE_MAPPING:
+            template = openapi_type_mapping[PYTHON_TYPE_MAPPING[obj]]
+        else:
+            warn(f'could not resolve type for "{obj}". defaulting to "string"')
+            template = openapi_type_mapping[OpenApiTypes.STR]
+    return template.copy()
 
 
 def build_array_type(schema: _SchemaType, min_length=None, max_length=None) -> _SchemaType:
@@ -360,6 +376,11 @@ def build_examples_list(examples: Sequence[OpenApiExample]) -> _SchemaType:
     return schema
 
 
+# field schema meta that does not apply to parameters
+_IRRELEVANT_PARAMETER_META = frozenset(['readOnly', 'writeOnly'])
+_IRRELEVANT_PATH_PARAMETER_META = _IRRELEVANT_PARAMETER_META | {'nullable', 'default'}
+
+
 def build_parameter_type(
         name: str,
         schema: _SchemaType,
@@ -376,9 +397,10 @@ def build_parameter_type(
         examples=None,
         extensions=None,
 ) -> _SchemaType:
-    irrelevant_field_meta = ['readOnly', 'writeOnly']
     if location == OpenApiParameter.PATH:
-        irrelevant_field_meta += ['nullable', 'default']
+        irrelevant_field_meta = _IRRELEVANT_PATH_PARAMETER_META
+    else:
+        irrelevant_field_meta = _IRRELEVANT_PARAMETER_META
     schema = {
         'in': location,
         'name': name,
@@ -418,21 +440,24 @@ def build_parameter_type(
 
 
 def build_choice_field(field) -> _SchemaType:
-    choices = list(OrderedDict.fromkeys(field.choices))  # preserve order and remove duplicates
+    choices = list(dict.fromkeys(field.choices))  # preserve order and remove duplicates
 
     if field.allow_blank and '' not in choices:
         choices.append('')
 
-    if not choices:
+    # inspect the few distinct classes instead of rescanning all choices for every candidate type
+    choice_classes = {choice.__class__ for choice in choices}
+
+    if not choice_classes:
         type = None
-    elif all(isinstance(choice, bool) for choice in choices):
+    elif all(issubclass(c, bool) for c in choice_classes):
         type = 'boolean'
-    elif all(isinstance(choice, int) for choice in choices):
+    elif all(issubclass(c, int) for c in choice_classes):
         type = 'integer'
-    elif all(isinstance(choice, (int, float, Decimal)) for choice in choices):  # `number` includes `integer`
+    elif all(issubclass(c, (int, float, Decimal)) for c in choice_classes):  # `number` includes `integer`
         # Ref: https://tools.ietf.org/html/draft-wright-json-schema-validation-00#section-5.21
         type = 'number'
-    elif all(isinstance(choice, str) for choice in choices):
+    elif all(issubclass(c, str) for c in choice_classes):
         type = 'string'
     else:
         type = None
@@ -680,16 +705,19 @@ def follow_model_field_lookup(model, lookup):
     return field
 
 
+_OPERATION_METHOD_PRIORITY = {
+    'GET': 0,
+    'POST': 1,
+    'PUT': 2,
+    'PATCH': 3,
+    'DELETE': 4
+}
+
+
 def alpha_operation_sorter(endpoint):
     """ sort endpoints first alphanumerically by path, then by method order """
     path, path_regex, method, callback = endpoint
-    method_priority = {
-        'GET': 0,
-        'POST': 1,
-        'PUT': 2,
-        'PATCH': 3,
-        'DELETE': 4
-    }.get(method, 5)
+    method_priority = _OPERATION_METHOD_PRIORITY.get(method, 5)
 
     # Sort foo{arg} after foo/, but before foo/bar
     if path.endswith('/'):
@@ -713,6 +741,8 @@ class ResolvedComponent:
     # OpenAPI 3.1.0+
     PATH_ITEM = 'pathItems'
 
+    __slots__ = ('name', 'type', 'schema', 'object')
+
     def __init__(self, name, type, schema=None, object=None):
         self.name = name
         self.type = type
@@ -743,6 +773,13 @@ class ComponentIdentity:
         return self.obj == other
 
 
+def _get_component_identity(obj):
+    """ classes and explicit identities stand for themselves, instances for their class """
+    if isinstance(obj, (ComponentIdentity, type)):
+        return obj
+    return obj.__class__
+
+
 class ComponentRegistry:
     def __init__(self) -> None:
         self._components: Dict[Tuple[str, str], ResolvedComponent] = {}
@@ -757,25 +794,23 @@ class ComponentRegistry:
         self._components[component.key] = component
 
     def register_on_missing(self, component: ResolvedComponent) -> None:
-        if component not in self:
-            self._components[component.key] = component
+        registered_component = self._components.setdefault(component.key, component)
+        if registered_component is not component:
+            self._check_identity_collision(component, registered_component)
 
     def __contains__(self, component):
-        if component.key not in self._components:
-            return False
+        return self.get(component) is not None
 
-        query_obj = component.object
-        registry_obj = self._components[component.key].object
+    def get(self, component: ResolvedComponent) -> Optional[ResolvedComponent]:
+        """ return the registered component with the same key (incl. its schema) or None """
+        registered_component = self._components.get(component.key)
+        if registered_component is not None:
+            self._check_identity_collision(component, registered_component)
+        return registered_component
 
-        if isinstance(query_obj, ComponentIdentity) or inspect.isclass(query_obj):
-            query_id = query_obj
-        else:
-            query_id = query_obj.__class__
-
-        if isinstance(registry_obj, ComponentIdentity) or inspect.isclass(registry_obj):
-            registry_id = registry_obj
-        else:
-            registry_id = registry_obj.__class__
+    def _check_identity_collision(self, component, registered_component) -> None:
+        query_id = _get_component_identity(component.object)
+        registry_id = _get_component_identity(registered_component.object)
 
         suppress_collision_warning = (
             get_override(registry_id, 'suppress_collision_warning', False)
@@ -787,7 +822,6 @@ class ComponentRegistry:
                 f'different identities {query_id} and {registry_id}. This will very '
                 f'likely result in an incorrect schema. Try renaming one.'
             )
-        return True
 
     def __getitem__(self, key) -> ResolvedComponent:
         if isinstance(key, ResolvedComponent):
@@ -806,17 +840,19 @@ class ComponentRegistry:
             output[component.type][component.name] = component.schema
         # add/override extra components
         for extra_type, extra_component_dict in extra_components.items():
-            for component_name, component_schema in extra_component_dict.items():
-                output[extra_type][component_name] = component_schema
+            output[extra_type].update(extra_component_dict)
         # sort by component type then by name
         return {
-            type: {name: output[type][name] for name in sorted(output[type].keys())}
-            for type in sorted(output.keys())
+            type: dict(sorted(output[type].items(), key=operator.itemgetter(0)))
+            for type in sorted(output)
         }
 
 
 class OpenApiGeneratorExtension(Generic[T], metaclass=ABCMeta):
     _registry: List[Type[T]] = []
+    # registry sorted by descending priority per extension base, and whether all of its
+    # extensions use the class-based default matching.
+    _sorted_registry_cache: Dict[type, Tuple[list, bool]] = {}
     target_class: Union[None, str, Type[object]] = None
     match_subclasses = False
     priority = 0
@@ -825,6 +861,11 @@ class OpenApiGeneratorExtension(Generic[T], metaclass=ABCMeta):
     def __init_subclass__(cls, **kwargs):
         super().__init_subclass__(**kwargs)
         cls._registry.append(cls)
+        # a new extension may take precedence over previously found matches
+        for base in list(OpenApiGeneratorExtension._sorted_registry_cache):
+            if base._registry is cls._registry:
+                del OpenApiGeneratorExtension._sorted_registry_cache[base]
+        _cached_extension_class_match.cache_clear()
 
     def __init__(self, target):
         self.target = target
@@ -852,6 +893,11 @@ class OpenApiGeneratorExtension(Generic[T], metaclass=ABCMeta):
 
     @classmethod
     def _matches(cls, target: Any) -> bool:
+        """
+        The default matching only looks at the target's class and its result is therefore
+        cached per class. Overriding this method disables said cache for the extension base
+        and the override gets called with every target (class or instance).
+        """
         if isinstance(cls.target_class, str):
             cls._load_class()
 
@@ -868,12 +914,42 @@ class OpenApiGeneratorExtension(Generic[T], metaclass=ABCMeta):
 
     @classmethod
     def get_match(cls, target) -> Optional[T]:
-        for extension in sorted(cls._registry, key=lambda e: e.priority, reverse=True):
+        _, class_based_matching = cls._get_sorted_registry()
+        if class_based_matching:
+            try:
+                extension = _cached_extension_class_match(cls, get_class(target))
+            except TypeError:  # pragma: no cover
+                extension = cls._find_match(target)  # unhashable class due to customized metaclass
+        else:
+            extension = cls._find_match(target)
+        return extension(target) if extension else None
+
+    @classmethod
+    def _get_sorted_registry(cls) -> Tuple[list, bool]:
+        if cls not in cls._sorted_registry_cache:
+            sorted_registry = sorted(cls._registry, key=lambda e: e.priority, reverse=True)
+            class_based_matching = all(
+                e._matches.__func__ is OpenApiGeneratorExtension._matches.__func__  # type: ignore
+                for e in sorted_registry
+            )
+            cls._sorted_registry_cache[cls] = sorted_registry, class_based_matching
+        return cls._sorted_registry_cache[cls]
+
+    @classmethod
+    def _find_match(cls, target) -> Optional[Type[T]]:
+        sorted_registry, _ = cls._get_sorted_registry()
+        for extension in sorted_registry:
             if extension._matches(target):
-                return extension(target)
+                return extension
         return None
 
 
+@functools.lru_cache(maxsize=1000)
+def _cached_extension_class_match(extension_base, target_class):
+    # only valid for the default matching, which solely depends on the target's class
+    return extension_base._find_match(target_class)
+
+
 def deep_import_string(string: str) -> Any:
     """ augmented import from string, e.g. MODULE.CLASS/OBJECT.ATTRIBUTE """
     try:
@@ -951,13 +1027,16 @@ def resolve_django_path_parameter(path_regex, variable, available_formats):
     convert django style path parameters to OpenAPI parameters.
     """
     registered_converters = get_converters()
+    coerce_path_pk = api_settings.SCHEMA_COERCE_PATH_PK
+    coerce_path_pk_suffix = spectacular_settings.SCHEMA_COERCE_PATH_PK_SUFFIX
+
     for match in _PATH_PARAMETER_COMPONENT_RE.finditer(path_regex):
         converter, parameter = match.group('converter'), match.group('parameter')
         enum_values = None
 
-        if api_settings.SCHEMA_COERCE_PATH_PK and parameter == 'pk':
+        if coerce_path_pk and parameter == 'pk':
             parameter = 'id'
-        elif spectacular_settings.SCHEMA_COERCE_PATH_PK_SUFFIX and parameter.endswith('_pk'):
+        elif coerce_path_pk_suffix and parameter.endswith('_pk'):
             parameter = f'{parameter[:-3]}_id'
 
         if parameter != variable:
@@ -1013,10 +1092,13 @@ def resolve_regex_path_parameter(path_regex, variable):
     convert regex path parameter to OpenAPI parameter, if pattern is
     explicitly chosen and not the generic non-empty default '[^/.]+'.
     """
+    coerce_path_pk = api_settings.SCHEMA_COERCE_PATH_PK
+    coerce_path_pk_suffix = spectacular_settings.SCHEMA_COERCE_PATH_PK_SUFFIX
+
     for parameter, pattern in analyze_named_regex_pattern(path_regex).items():
-        if api_settings.SCHEMA_COERCE_PATH_PK and parameter == 'pk':
+        if coerce_path_pk and parameter == 'pk':
             parameter = 'id'
-        elif spectacular_settings.SCHEMA_COERCE_PATH_PK_SUFFIX and parameter.endswith('_pk'):
+        elif coerce_path_pk_suffix and parameter.endswith('_pk'):
             parameter = f'{parameter[:-3]}_id'
 
         if parameter != variable:
@@ -1109,8 +1191,17 @@ def modify_media_types_for_versioning(view, media_types: List[str]) -> List[str]
     ]
 
 
+_NAMED_REGEX_SPECIAL_CHARS_RE = re.compile(r'[\\()>]')
+
+
 def analyze_named_regex_pattern(path: str) -> Dict[str, str]:
     """ safely extract named groups and their pattern from given regex pattern """
+    return dict(_cached_analyze_named_regex_pattern(path))
+
+
+@functools.lru_cache(maxsize=1000)
+def _cached_analyze_named_regex_pattern(path: str) -> Tuple[Tuple[str, str], ...]:
+    # the same regex is analyzed for every parameter of the path and again for detyping
     result = {}
     stack = 0
     name_capture, name_buffer = False, ''
@@ -1143,7 +1234,9 @@ def analyze_named_regex_pattern(path: str) -> Dict[str, str]:
                 stack -= 1
             ff = 1
         else:
-            ff = 1
+            # skip ahead over plain characters at once, as they cannot change the state
+            next_special = _NAMED_REGEX_SPECIAL_CHARS_RE.search(path, i + 1)
+            ff = (next_special.start() if next_special else len(path)) - i
         # fill buffer based on state
         if name_capture and not skip:
             name_buffer += path[i:i + ff]
@@ -1151,7 +1244,10 @@ def analyze_named_regex_pattern(path: str) -> Dict[str, str]:
             regex_buffer += path[i:i + ff]
         i += ff
     assert not stack
-    return result
+    return tuple(result.items())
+
+
+_TYPED_ROUTE_PARAMETER_RE = re.compile(r'<\w+:(\w+)>')
 
 
 @cache
@@ -1183,7 +1279,7 @@ def detype_pattern(pattern):
         )
     elif isinstance(pattern, RoutePattern):
         return RoutePattern(
-            route=re.sub(r'<\w+:(\w+)>', r'<\1>', pattern._route),
+            route=_TYPED_ROUTE_PARAMETER_RE.sub(r'<\1>', pattern._route),
             name=pattern.name,
             is_endpoint=pattern._is_endpoint
         )
@@ -1204,15 +1300,21 @@ def detype_pattern(pattern):
         return pattern
 
 
+_RESULT_BASE_TYPES = (bool, int, float, str)
+_RESULT_VERBATIM_TYPES = frozenset([*_RESULT_BASE_TYPES, type(None)])
+
+
 def normalize_result_object(result):
     """ resolve non-serializable objects like lazy translation strings and OrderedDict """
-    if isinstance(result, dict) or isinstance(result, OrderedDict):
+    if type(result) in _RESULT_VERBATIM_TYPES:
+        return result  # fast path for the bulk of the leaves, which need no coercion
+    if isinstance(result, dict):  # includes OrderedDict
         return {k: normalize_result_object(v) for k, v in result.items()}
-    if isinstance(result, list) or isinstance(result, tuple):
+    if isinstance(result, (list, tuple)):
         return [normalize_result_object(v) for v in result]
     if isinstance(result, Promise):
         return str(result)
-    for base_type in [bool, int, float, str]:
+    for base_type in _RESULT_BASE_TYPES:
         if isinstance(result, base_type):
             return base_type(result)  # coerce basic sub types
     return result
@@ -1220,13 +1322,20 @@ def normalize_result_object(result):
 
 def sanitize_result_object(result):
     # warn about and resolve operationId collisions with suffixes
-    operations = defaultdict(list)
+    operations, collisions = {}, {}
     for path, methods in result['paths'].items():
         for method, operation in methods.items():
-            operations[operation['operationId']].append((path, method))
-    for operation_id, paths in operations.items():
-        if len(paths) == 1:
+            operation_id = operation['operationId']
+            if operation_id not in operations:
+                operations[operation_id] = (path, method)
+            else:
+                collisions.setdefault(operation_id, [operations[operation_id]]).append((path, method))
+    if not collisions:
+        return result
+    for operation_id in operations:  # report in order of first appearance
+        if operation_id not in collisions:
             continue
+        paths = collisions[operation_id]
         warn(f'operationId "{operation_id}" has collisions {paths}. resolving with numeral suffixes.')
         for idx, (path, method) in enumerate(sorted(paths)[1:], start=2):
             suffix = str(idx) if spectacular_settings.CAMELIZE_NAMES else f'_{idx}'
@@ -1239,19 +1348,21 @@ def sanitize_specification_extensions(extensions):
     # https://spec.openapis.org/oas/v3.0.3#specification-extensions
     output = {}
     for key, value in extensions.items():
-        if not re.match(r'^x-', key):
+        if not key.startswith('x-'):
             warn(f'invalid extension {key!r}. vendor extensions must start with "x-"')
         else:
             output[key] = value
     return output
 
 
+_CAMELIZE_PATH_VARIABLE_RE = re.compile(r'\{(\w+)\}')
+
+
 def camelize_operation(path, operation):
-    for path_variable in re.findall(r'\{(\w+)\}', path):
-        path = path.replace(
-            f'{{{path_variable}}}',
-            f'{{{inflection.camelize(path_variable, False)}}}'
-        )
+    path = _CAMELIZE_PATH_VARIABLE_RE.sub(
+        lambda match: f'{{{inflection.camelize(match.group(1), False)}}}',
+        path,
+    )
 
     for parameter in operation.get('parameters', []):
         if parameter['in'] == OpenApiParameter.PATH:
@@ -1262,6 +1373,9 @@ def camelize_operation(path, operation):
     return path, operation
 
 
+_MOCK_REQUEST_IGNORED_HEADERS = frozenset(['HTTP_ACCEPT', 'HTTP_COOKIE', 'HTTP_AUTHORIZATION'])
+
+
 def build_mock_request(method, path, view, original_request, **kwargs):
     """ build a mocked request and use original request as reference if available """
     request = getattr(APIRequestFactory(), method.lower())(path=path)
@@ -1273,11 +1387,8 @@ def build_mock_request(method, path, view, original_request, **kwargs):
         # also ignore ACCEPT as the MIME type refers to SpectacularAPIView and the
         # version (if available) has already been processed by SpectacularAPIView.
         for name, value in original_request.META.items():
-            if not name.startswith('HTTP_'):
-                continue
-            if name in ['HTTP_ACCEPT', 'HTTP_COOKIE', 'HTTP_AUTHORIZATION']:
-                continue
-            request.META[name] = value
+            if name.startswith('HTTP_') and name not in _MOCK_REQUEST_IGNORED_HEADERS:
+                request.META[name] = value
     return request
 
 
@@ -1285,7 +1396,7 @@ def set_query_parameters(url, **kwargs) -> str:
     """ deconstruct url, safely attach query parameters in kwargs, and serialize again """
     url = str(url)  # Force evaluation of reverse_lazy urls
     scheme, netloc, path, params, query, fragment = urllib.parse.urlparse(url)
-    query = urllib.parse.parse_qs(query)
+    query = urllib.parse.parse_qs(query) if query else {}
     query.update({k: v for k, v in kwargs.items() if v is not None})
     query = urllib.parse.urlencode(query, doseq=True)
     return urllib.parse.urlunparse((scheme, netloc, path, params, query, fragment))
@@ -1293,8 +1404,8 @@ def set_query_parameters(url, **kwargs) -> str:
 
 def get_relative_url(url: str) -> str:
     url = str(url)  # Force evaluation of reverse_lazy urls
-    scheme, netloc, path, params, query, fragment = urllib.parse.urlparse(url)
-    return urllib.parse.urlunparse(('', '', path, params, query, fragment))
+    scheme, netloc, path, query, fragment = urllib.parse.urlsplit(url)
+    return urllib.parse.urlunsplit(('', '', path, query, fragment))
 
 
 def _get_type_hint_origin(hint):
@@ -1319,7 +1430,7 @@ def _resolve_typeddict(hint):
     required = None
 
     if hasattr(hint, '__required_keys__'):
-        required = [h for h in hint.__required_keys__]
+        required = list(hint.__required_keys__)
 
     return build_object_type(
         properties={
@@ -1367,9 +1478,7 @@ def resolve_type_hint(hint):
         if args and args[1] is not typing.Any:
             schema['additionalProperties'] = resolve_type_hint(args[1])
         return schema
-    elif origin is set:
-        return build_array_type(resolve_type_hint(args[0]))
-    elif origin is frozenset:
+    elif origin is set or origin is frozenset:
         return build_array_type(resolve_type_hint(args[0]))
     elif origin in LITERAL_TYPES:
         # Literal only works for python >= 3.8 despite typing_extensions, because it
@@ -1468,8 +1577,19 @@ def build_listed_example_value(value: Any, paginator, direction):
         return value
 
 
+@functools.lru_cache(maxsize=1000)
+def _cached_signature(func) -> inspect.Signature:
+    return inspect.signature(func)
+
+
 def filter_supported_arguments(func, **kwargs):
-    sig = inspect.signature(func)
+    # bound methods are recreated on every access, so cache on the underlying function. its
+    # additional self/cls parameter does not matter here as it is never passed by keyword.
+    func = getattr(func, '__func__', func)
+    try:
+        sig = _cached_signature(func)
+    except TypeError:
+        sig = inspect.signature(func)  # unhashable object
     return {
         arg: val for arg, val in kwargs.items() if arg in sig.parameters
     }
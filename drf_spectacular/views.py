@@ -63,7 +63,7 @@ class SpectacularAPIView(APIView):
     @extend_schema(**SCHEMA_KWARGS)
     def get(self, request, *args, **kwargs):
         # special handling of custom urlconf parameter
-        if isinstance(self.urlconf, list) or isinstance(self.urlconf, tuple):
+        if isinstance(self.urlconf, (list, tuple)):
             ModuleWrapper = namedtuple('ModuleWrapper', ['urlpatterns'])
             if all(isinstance(i, str) for i in self.urlconf):
                 # list of import string for urlconf
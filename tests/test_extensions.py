@@ -13,7 +13,8 @@ from drf_spectacular.extensions import (
     OpenApiViewExtension,
 )
 from drf_spectacular.plumbing import (
-    ResolvedComponent, build_array_type, build_basic_type, build_object_type, force_instance,
+    OpenApiGeneratorExtension, ResolvedComponent, build_array_type, build_basic_type,
+    build_object_type, force_instance,
 )
 from drf_spectacular.types import OpenApiTypes
 from drf_spectacular.utils import Direction, extend_schema, extend_schema_field, extend_schema_view
@@ -156,6 +157,83 @@ def test_extension_not_found_for_installed_app(capsys):
     assert 'target class was not found' in capsys.readouterr().err
 
 
+class LateExtensionTarget:
+    pass
+
+
+def test_extension_match_takes_late_registration_into_account():
+    class EarlyExtension(OpenApiViewExtension):
+        target_class = 'tests.test_extensions.LateExtensionTarget'
+
+        def view_replacement(self):
+            pass  # pragma: no cover
+
+    assert isinstance(OpenApiViewExtension.get_match(LateExtensionTarget()), EarlyExtension)
+    assert isinstance(OpenApiViewExtension.get_match(LateExtensionTarget), EarlyExtension)
+
+    class LateExtension(OpenApiViewExtension):
+        target_class = 'tests.test_extensions.LateExtensionTarget'
+        priority = 1
+
+        def view_replacement(self):
+            pass  # pragma: no cover
+
+    assert isinstance(OpenApiViewExtension.get_match(LateExtensionTarget()), LateExtension)
+
+
+class InstanceSensitiveTarget:
+    def __init__(self, special=False):
+        self.special = special
+
+
+def test_extension_match_with_instance_sensitive_matching():
+    class InstanceSensitiveExtension(OpenApiViewExtension):
+        target_class = 'tests.test_extensions.InstanceSensitiveTarget'
+
+        @classmethod
+        def _matches(cls, target):
+            return super()._matches(target) and getattr(target, 'special', False)
+
+        def view_replacement(self):
+            pass  # pragma: no cover
+
+    assert OpenApiViewExtension.get_match(InstanceSensitiveTarget()) is None
+    assert isinstance(
+        OpenApiViewExtension.get_match(InstanceSensitiveTarget(special=True)), InstanceSensitiveExtension
+    )
+    assert OpenApiViewExtension.get_match(InstanceSensitiveTarget()) is None
+
+
+class SortedRegistryTarget:
+    pass
+
+
+def test_extension_registration_only_invalidates_own_sorted_registry():
+    class EarlyExtension(OpenApiViewExtension):
+        target_class = 'tests.test_extensions.SortedRegistryTarget'
+
+        def view_replacement(self):
+            pass  # pragma: no cover
+
+    # populate the sorted registry of two different extension bases
+    assert isinstance(OpenApiViewExtension.get_match(SortedRegistryTarget()), EarlyExtension)
+    assert OpenApiSerializerExtension.get_match(SortedRegistryTarget()) is None
+    sorted_registry_cache = OpenApiGeneratorExtension._sorted_registry_cache
+    serializer_registry = sorted_registry_cache[OpenApiSerializerExtension]
+    assert OpenApiViewExtension in sorted_registry_cache
+
+    class LateExtension(OpenApiViewExtension):
+        target_class = 'tests.test_extensions.SortedRegistryTarget'
+        priority = 1
+
+        def view_replacement(self):
+            pass  # pragma: no cover
+
+    assert OpenApiViewExtension not in sorted_registry_cache
+    assert sorted_registry_cache[OpenApiSerializerExtension] is serializer_registry
+    assert isinstance(OpenApiViewExtension.get_match(SortedRegistryTarget()), LateExtension)
+
+
 class MultiHeaderAuth(BaseAuthentication):
     pass
 
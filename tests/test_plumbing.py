@@ -22,8 +22,9 @@ from rest_framework import generics, serializers
 from drf_spectacular.openapi import AutoSchema
 from drf_spectacular.plumbing import (
     analyze_named_regex_pattern, build_basic_type, build_choice_field, detype_pattern,
-    follow_field_source, force_instance, get_list_serializer, get_relative_url, is_field,
-    is_serializer, resolve_type_hint, safe_ref, set_query_parameters,
+    filter_supported_arguments, follow_field_source, force_instance, get_list_serializer,
+    get_relative_url, get_type_hints, is_field, is_list_serializer, is_serializer,
+    resolve_type_hint, safe_ref, set_query_parameters,
 )
 from drf_spectacular.validation import validate_schema
 from tests import generate_schema
@@ -46,6 +47,32 @@ def test_is_serializer():
     assert is_serializer(serializers.Serializer())
 
 
+def test_type_predicates_do_not_instantiate_classes():
+    class XSerializer(serializers.Serializer):
+        def __init__(self, *args, **kwargs):
+            raise AssertionError('must not be instantiated')  # pragma: no cover
+
+    class XField(serializers.CharField):
+        def __init__(self, *args, **kwargs):
+            raise AssertionError('must not be instantiated')  # pragma: no cover
+
+    assert is_serializer(XSerializer)
+    assert not is_field(XSerializer)
+    assert not is_serializer(XField)
+    assert is_field(XField)
+
+
+def test_is_list_serializer():
+    # plain ListSerializer cannot be instantiated without child and must not be
+    assert is_list_serializer(serializers.ListSerializer)
+    assert is_list_serializer(serializers.Serializer(many=True))
+
+    assert not is_list_serializer(serializers.Serializer)
+    assert not is_list_serializer(serializers.Serializer())
+    assert not is_list_serializer(serializers.ListField)
+    assert not is_list_serializer(serializers.ListField())
+
+
 def test_is_field():
     assert is_field(serializers.SlugField)
     assert is_field(serializers.SlugField())
@@ -377,6 +404,30 @@ def test_analyze_named_regex_pattern(no_warnings, pattern, output):
     assert analyze_named_regex_pattern(pattern) == output
 
 
+def test_get_type_hints_of_methods():
+    class X:
+        def f(self, a: int) -> str:
+            pass  # pragma: no cover
+
+    assert get_type_hints(X.f) == {'a': int, 'return': str}
+    assert get_type_hints(X().f) == {'a': int, 'return': str}
+    # cached hints must not be affected by modifications
+    get_type_hints(X.f).clear()
+    assert get_type_hints(X.f) == {'a': int, 'return': str}
+
+
+def test_filter_supported_arguments_of_unhashable_callable():
+    class UnhashableCallable:
+        def __eq__(self, other):
+            return self is other  # pragma: no cover
+
+        def __call__(self, a, b=None):
+            pass  # pragma: no cover
+
+    func = UnhashableCallable()
+    assert filter_supported_arguments(func, a=1, c=3) == {'a': 1}
+
+
 def test_unknown_basic_type(capsys):
     build_basic_type(object)
     assert 'could not resolve type for "<class \'object\'>' in capsys.readouterr().err
@@ -3461,3 +3461,62 @@ def test_primary_key_related_field_with_custom_pk_field(no_warnings):
     assert schema['components']['schemas']['X']['properties']['field'] == {
         'readOnly': True, 'type': 'integer'
     }
+
+
+def test_list_view_detection_does_not_refetch_response_serializer(no_warnings):
+    class XViewset(viewsets.ReadOnlyModelViewSet):
+        serializer_class = SimpleSerializer
+        queryset = SimpleModel.objects.none()
+
+    with mock.patch.object(
+        AutoSchema, 'get_response_serializers', autospec=True, return_value=SimpleSerializer()
+    ) as get_response_serializers:
+        schema = generate_schema('/x', XViewset)
+
+    assert schema['paths']['/x/']['get']['operationId'] == 'x_list'
+    # per operation: one memoized lookup for all list view checks and one for building the responses
+    assert get_response_serializers.call_count == 2 * 2
+
+
+def test_paginator_is_only_instantiated_once_per_operation(no_warnings):
+    class XPagination(pagination.LimitOffsetPagination):
+        instances = 0
+
+        def __init__(self):
+            XPagination.instances += 1
+
+    class XViewset(viewsets.ReadOnlyModelViewSet):
+        serializer_class = SimpleSerializer
+        queryset = SimpleModel.objects.none()
+        pagination_class = XPagination
+
+        @extend_schema(responses={200: SimpleSerializer(many=True), 201: SimpleSerializer(many=True)})
+        def list(self, request):
+            pass  # pragma: no cover
+
+    schema = generate_schema('/x', XViewset)
+    assert 'PaginatedSimpleList' in schema['components']['schemas']
+    # only the list operation uses the paginator, i.e. parameters and two response codes
+    assert XPagination.instances == 1
+
+
+def test_paginator_is_available_outside_of_get_operation(no_warnings):
+    class XAPIView(generics.ListAPIView):
+        serializer_class = SimpleSerializer
+        queryset = SimpleModel.objects.none()
+        pagination_class = pagination.LimitOffsetPagination
+
+    schema = XAPIView().schema
+    schema.path, schema.method = '/x/', 'GET'
+    assert isinstance(schema._get_paginator(), pagination.LimitOffsetPagination)
+
+
+def test_map_renderers_is_available_outside_of_get_operation(no_warnings):
+    class XAPIView(generics.ListAPIView):
+        serializer_class = SimpleSerializer
+        queryset = SimpleModel.objects.none()
+        renderer_classes = [renderers.JSONRenderer]
+
+    schema = XAPIView().schema
+    schema.path, schema.method = '/x/', 'GET'
+    assert schema.map_renderers('media_type') == ['application/json']